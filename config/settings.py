@@ -171,4 +171,4 @@ LOGGING = {
         'handlers': ['console'],
         'level': 'INFO',
     },
-}d
\ No newline at end of file
+}
\ No newline at end of file
@@ -1,4 +0,0 @@
-from .household import Household
-from .person import Person
-from .technology import Technology
-from .education import Education
\ No newline at end of file
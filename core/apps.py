@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """
+    App configuration for the core digital divide analysis app.
+    """
+    name = 'core'
+
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
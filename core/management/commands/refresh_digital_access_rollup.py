@@ -0,0 +1,17 @@
+"""
+Rebuild the precomputed Digital Access rollup used by dashboards.
+
+Intended to run on a schedule (e.g. nightly) and after bulk data loads.
+"""
+
+from django.core.management.base import BaseCommand
+
+from core.models import DigitalAccessRollup
+
+
+class Command(BaseCommand):
+    help = "Recalculate the Digital Access rollup per province and area type"
+
+    def handle(self, *args, **options):
+        count = DigitalAccessRollup.objects.refresh()
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {count} rollup rows"))
@@ -0,0 +1,141 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:37
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Education',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('current_education_level', models.CharField(choices=[('none', 'No Formal Education'), ('primary', 'Primary School'), ('secondary', 'Secondary School'), ('high_school', 'High School'), ('vocational', 'Vocational Training'), ('associates', "Associate's Degree"), ('bachelors', "Bachelor's Degree"), ('masters', "Master's Degree"), ('doctorate', 'Doctorate'), ('other', 'Other')], default='none', max_length=50)),
+                ('is_currently_enrolled', models.BooleanField(default=False)),
+                ('school_name', models.CharField(blank=True, max_length=200, null=True)),
+                ('school_type', models.CharField(blank=True, choices=[('public', 'Public'), ('private', 'Private'), ('charter', 'Charter'), ('homeschool', 'Homeschool'), ('other', 'Other')], max_length=50, null=True)),
+                ('grade_point_average', models.FloatField(blank=True, null=True)),
+                ('years_of_education', models.PositiveIntegerField(default=0)),
+                ('has_special_education', models.BooleanField(default=False)),
+                ('primary_language', models.CharField(default='English', max_length=50)),
+                ('is_bilingual', models.BooleanField(default=False)),
+                ('receives_financial_aid', models.BooleanField(default=False)),
+                ('scholarship_amount', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('has_access_to_computer', models.BooleanField(default=False)),
+                ('participates_in_remote_learning', models.BooleanField(default=False)),
+                ('participates_in_extracurricular', models.BooleanField(default=False)),
+                ('extracurricular_activities', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Education',
+                'db_table': 'education',
+            },
+        ),
+        migrations.CreateModel(
+            name='Household',
+            fields=[
+                ('household_id', models.CharField(help_text='Unique identifier for the household', max_length=20, primary_key=True, serialize=False)),
+                ('province', models.CharField(choices=[('EC', 'Eastern Cape'), ('FS', 'Free State'), ('GP', 'Gauteng'), ('KZN', 'KwaZulu-Natal'), ('LP', 'Limpopo'), ('MP', 'Mpumalanga'), ('NC', 'Northern Cape'), ('NW', 'North West'), ('WC', 'Western Cape')], help_text='Province where the household is located', max_length=3)),
+                ('municipality', models.CharField(help_text='Municipality name', max_length=100)),
+                ('area_type', models.CharField(choices=[('URB', 'Urban'), ('RUR', 'Rural'), ('INF', 'Informal Settlement')], help_text='Type of settlement area', max_length=3)),
+                ('household_size', models.PositiveIntegerField(help_text='Number of people in the household', validators=[django.core.validators.MinValueValidator(1)])),
+                ('monthly_income', models.DecimalField(blank=True, decimal_places=2, help_text='Monthly household income in Rand', max_digits=10, null=True)),
+                ('has_electricity', models.BooleanField(default=False, help_text='Whether the household has electricity access')),
+                ('has_internet', models.BooleanField(default=False, help_text='Whether the household has internet access')),
+                ('internet_type', models.CharField(choices=[('NONE', 'No Internet'), ('FIBER', 'Fiber'), ('ADSL', 'ADSL'), ('MOB', 'Mobile Data'), ('SAT', 'Satellite')], default='NONE', help_text='Type of internet connection', max_length=5)),
+                ('number_of_computers', models.PositiveIntegerField(default=0, help_text='Number of computers/laptops in the household')),
+                ('number_of_smartphones', models.PositiveIntegerField(default=0, help_text='Number of smartphones in the household')),
+                ('digital_access_index', models.FloatField(blank=True, help_text='Calculated Digital Access Index score (0-1)', null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)])),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp when the record was created')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp when the record was last updated')),
+            ],
+            options={
+                'verbose_name': 'Household',
+                'verbose_name_plural': 'Households',
+                'ordering': ['province', 'municipality'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TechnologyAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('has_internet', models.BooleanField(default=False)),
+                ('internet_type', models.CharField(choices=[('none', 'No Internet'), ('broadband', 'Broadband'), ('mobile', 'Mobile Data'), ('satellite', 'Satellite'), ('dial_up', 'Dial-up'), ('other', 'Other')], default='none', max_length=50)),
+                ('internet_speed_mbps', models.FloatField(blank=True, null=True)),
+                ('num_smartphones', models.PositiveIntegerField(default=0)),
+                ('num_computers', models.PositiveIntegerField(default=0)),
+                ('num_tablets', models.PositiveIntegerField(default=0)),
+                ('has_smart_tv', models.BooleanField(default=False)),
+                ('has_smart_speaker', models.BooleanField(default=False)),
+                ('has_smart_thermostat', models.BooleanField(default=False)),
+                ('has_gaming_console', models.BooleanField(default=False)),
+                ('has_streaming_service', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('household', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='technology_access', to='core.household')),
+            ],
+            options={
+                'verbose_name_plural': 'Technology Access',
+                'db_table': 'technology_access',
+            },
+        ),
+        migrations.CreateModel(
+            name='Person',
+            fields=[
+                ('person_id', models.CharField(help_text='Unique identifier for the person', max_length=20, primary_key=True, serialize=False)),
+                ('age', models.PositiveIntegerField(help_text='Age in years', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(120)])),
+                ('gender', models.CharField(choices=[('M', 'Male'), ('F', 'Female'), ('O', 'Other')], help_text='Gender of the person', max_length=1)),
+                ('education_level', models.CharField(choices=[('NONE', 'No Formal Education'), ('PRIM', 'Primary School'), ('SECO', 'Secondary School'), ('MATR', 'Matric Completed'), ('DIPL', 'Diploma/Certificate'), ('DEGR', 'University Degree'), ('POST', 'Postgraduate Degree')], help_text='Highest level of education completed', max_length=4)),
+                ('currently_studying', models.BooleanField(default=False, help_text='Whether the person is currently enrolled in education')),
+                ('school_type', models.CharField(choices=[('PUB', 'Public School'), ('PRI', 'Private School'), ('TVET', 'TVET College'), ('UNI', 'University'), ('NONE', 'Not Enrolled')], default='NONE', help_text='Type of educational institution currently attending', max_length=4)),
+                ('has_own_device', models.BooleanField(default=False, help_text='Whether the person has their own computing device')),
+                ('device_type', models.CharField(blank=True, help_text='Type of personal computing device owned', max_length=50, null=True)),
+                ('internet_usage_hours', models.FloatField(default=0.0, help_text='Average daily internet usage in hours', validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(24.0)])),
+                ('uses_internet_for_education', models.BooleanField(default=False, help_text='Whether internet is used for educational purposes')),
+                ('average_academic_score', models.FloatField(blank=True, help_text='Average academic score (percentage)', null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(100.0)])),
+                ('digital_literacy_score', models.FloatField(blank=True, help_text='Calculated digital literacy score (0-1)', null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)])),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp when the record was created')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp when the record was last updated')),
+                ('household', models.ForeignKey(help_text='Associated household', on_delete=django.db.models.deletion.CASCADE, related_name='household_members', to='core.household')),
+            ],
+            options={
+                'verbose_name': 'Person',
+                'verbose_name_plural': 'People',
+                'ordering': ['household', 'age'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(fields=['province', 'area_type'], name='core_househ_provinc_6b8ff4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(fields=['digital_access_index'], name='core_househ_digital_b3cce8_idx'),
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='person',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='education', to='core.person'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['household', 'education_level'], name='core_person_househo_d47e3d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['digital_literacy_score'], name='core_person_digital_45c275_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['age', 'education_level'], name='core_person_age_33f030_idx'),
+        ),
+    ]
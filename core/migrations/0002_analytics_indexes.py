@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='household',
+            name='core_househ_provinc_6b8ff4_idx',
+        ),
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(fields=['province', 'area_type', 'has_internet'], name='core_househ_provinc_a2ea4f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(fields=['internet_type', 'province'], name='core_househ_interne_38635f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(condition=models.Q(('has_internet', True)), fields=['province'], name='hh_prov_haveint'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['household', 'currently_studying', 'education_level'], name='core_person_househo_da7ac2_idx'),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:40
+
+from django.db import migrations, models
+
+EDUCATION_LEVELS = {
+    'none': 0,
+    'primary': 1,
+    'secondary': 2,
+    'high_school': 3,
+    'vocational': 4,
+    'associates': 5,
+    'bachelors': 6,
+    'masters': 7,
+    'doctorate': 8,
+    'other': 9,
+}
+
+PERSON_EDUCATION_LEVELS = {
+    'NONE': 0,
+    'PRIM': 1,
+    'SECO': 2,
+    'MATR': 3,
+    'DIPL': 4,
+    'DEGR': 5,
+    'POST': 6,
+}
+
+
+def _convert(queryset, field_name, mapping):
+    """
+    Rewrite each stored value of field_name using mapping, one UPDATE per value.
+    """
+    for old, new in mapping.items():
+        queryset.filter(**{field_name: old}).update(**{field_name: new})
+
+
+def codes_to_integers(apps, schema_editor):
+    Education = apps.get_model('core', 'Education')
+    Person = apps.get_model('core', 'Person')
+    _convert(Education.objects.all(), 'current_education_level',
+             {old: str(new) for old, new in EDUCATION_LEVELS.items()})
+    _convert(Person.objects.all(), 'education_level',
+             {old: str(new) for old, new in PERSON_EDUCATION_LEVELS.items()})
+
+
+def integers_to_codes(apps, schema_editor):
+    Education = apps.get_model('core', 'Education')
+    Person = apps.get_model('core', 'Person')
+    _convert(Education.objects.all(), 'current_education_level',
+             {str(new): old for old, new in EDUCATION_LEVELS.items()})
+    _convert(Person.objects.all(), 'education_level',
+             {str(new): old for old, new in PERSON_EDUCATION_LEVELS.items()})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_analytics_indexes'),
+    ]
+
+    # The codes are first rewritten to their integer values while the
+    # columns are still text, so the type change is a plain cast.
+    operations = [
+        migrations.RunPython(codes_to_integers, integers_to_codes),
+        migrations.AlterField(
+            model_name='education',
+            name='current_education_level',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'No Formal Education'), (1, 'Primary School'), (2, 'Secondary School'), (3, 'High School'), (4, 'Vocational Training'), (5, "Associate's Degree"), (6, "Bachelor's Degree"), (7, "Master's Degree"), (8, 'Doctorate'), (9, 'Other')], default=0),
+        ),
+        migrations.AlterField(
+            model_name='person',
+            name='education_level',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'No Formal Education'), (1, 'Primary School'), (2, 'Secondary School'), (3, 'Matric Completed'), (4, 'Diploma/Certificate'), (5, 'University Degree'), (6, 'Postgraduate Degree')], help_text='Highest level of education completed'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:45
+
+from django.db import migrations, models
+
+# Old TechnologyAccess codes and their shared equivalents. Generic
+# broadband is recorded as ADSL, the fixed-line type it most often is in
+# the GHS data; both fixed-line types earn the same fast-connection bonus.
+TECHNOLOGY_INTERNET_TYPES = {
+    'none': 'NONE',
+    'broadband': 'ADSL',
+    'mobile': 'MOB',
+    'satellite': 'SAT',
+    'dial_up': 'DIAL',
+    'other': 'OTHER',
+}
+
+
+def to_shared_codes(apps, schema_editor):
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    for old, new in TECHNOLOGY_INTERNET_TYPES.items():
+        TechnologyAccess.objects.filter(internet_type=old).update(internet_type=new)
+
+
+def to_technology_codes(apps, schema_editor):
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    for old, new in TECHNOLOGY_INTERNET_TYPES.items():
+        TechnologyAccess.objects.filter(internet_type=new).update(internet_type=old)
+    TechnologyAccess.objects.filter(internet_type='FIBER').update(internet_type='broadband')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_education_level_integers'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='household',
+            name='internet_type',
+            field=models.CharField(choices=[('NONE', 'No Internet'), ('FIBER', 'Fiber'), ('ADSL', 'ADSL'), ('MOB', 'Mobile Data'), ('SAT', 'Satellite'), ('DIAL', 'Dial-up'), ('OTHER', 'Other')], default='NONE', help_text='Type of internet connection', max_length=5),
+        ),
+        # Codes are rewritten while the column is still wide enough to
+        # hold the old values.
+        migrations.RunPython(to_shared_codes, to_technology_codes),
+        migrations.AlterField(
+            model_name='technologyaccess',
+            name='internet_type',
+            field=models.CharField(choices=[('NONE', 'No Internet'), ('FIBER', 'Fiber'), ('ADSL', 'ADSL'), ('MOB', 'Mobile Data'), ('SAT', 'Satellite'), ('DIAL', 'Dial-up'), ('OTHER', 'Other')], default='NONE', max_length=5),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:39
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+
+def populate_household_has_internet(apps, schema_editor):
+    # Frozen copy of PersonQuerySet.sync_household_internet()
+    Household = apps.get_model('core', 'Household')
+    Person = apps.get_model('core', 'Person')
+    Person.objects.update(household_has_internet=Exists(
+        Household.objects.filter(pk=OuterRef('household_id'), has_internet=True)
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_shared_internet_type_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='person',
+            name='household_has_internet',
+            field=models.BooleanField(default=False, help_text="Whether the person's household has internet access"),
+        ),
+        migrations.RunPython(
+            populate_household_has_internet, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_person_household_has_internet'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DigitalAccessRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('province', models.CharField(choices=[('EC', 'Eastern Cape'), ('FS', 'Free State'), ('GP', 'Gauteng'), ('KZN', 'KwaZulu-Natal'), ('LP', 'Limpopo'), ('MP', 'Mpumalanga'), ('NC', 'Northern Cape'), ('NW', 'North West'), ('WC', 'Western Cape')], help_text='Province the totals cover', max_length=3)),
+                ('area_type', models.CharField(choices=[('URB', 'Urban'), ('RUR', 'Rural'), ('INF', 'Informal Settlement')], help_text='Type of settlement area the totals cover', max_length=3)),
+                ('household_count', models.PositiveIntegerField(help_text='Number of households')),
+                ('mean_digital_access_index', models.FloatField(blank=True, help_text='Mean Digital Access Index of the households', null=True)),
+                ('total_computers', models.PositiveIntegerField(help_text='Total number of computers/laptops in the households')),
+                ('refreshed_at', models.DateTimeField(help_text='Timestamp when the totals were last recalculated')),
+            ],
+            options={
+                'verbose_name': 'Digital Access Rollup',
+                'verbose_name_plural': 'Digital Access Rollups',
+                'db_table': 'digital_access_rollup',
+                'ordering': ['province', 'area_type'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='digitalaccessrollup',
+            constraint=models.UniqueConstraint(fields=('province', 'area_type'), name='rollup_province_area_unique'),
+        ),
+    ]
@@ -0,0 +1,123 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:52
+
+from django.db import migrations, models
+from django.db.models.functions import Length
+
+# Bit of smart_device_flags for each former boolean column
+SMART_DEVICE_FLAGS = {
+    'has_smart_tv': 1,
+    'has_smart_speaker': 2,
+    'has_smart_thermostat': 4,
+}
+
+# New max_length of each narrowed column
+FIELD_WIDTHS = {
+    ('Household', 'municipality'): 60,
+    ('Education', 'school_name'): 120,
+    ('Education', 'school_type'): 10,
+    ('Education', 'primary_language'): 30,
+}
+
+# Number of offending primary keys listed per column in the error
+MAX_REPORTED_ROWS = 20
+
+
+def _values_with(flag):
+    """
+    Return every possible smart_device_flags value with flag set.
+    """
+    return [value for value in range(8) if value & flag]
+
+
+def check_field_widths(apps, schema_editor):
+    """
+    Refuse to narrow a column while it holds longer values, naming the rows
+    to fix, rather than failing or truncating inside the ALTER.
+    """
+    problems = []
+    for (model_name, field), width in FIELD_WIDTHS.items():
+        Model = apps.get_model('core', model_name)
+        too_long = Model.objects.annotate(
+            value_length=Length(field)
+        ).filter(value_length__gt=width).order_by('pk').values_list('pk', flat=True)
+        count = too_long.count()
+        if count:
+            problems.append(
+                f"{model_name}.{field} ({count} longer than {width} characters, "
+                f"pk: {', '.join(str(pk) for pk in too_long[:MAX_REPORTED_ROWS])})"
+            )
+    if problems:
+        raise ValueError(
+            "Shorten these values before applying this migration: " +
+            "; ".join(problems)
+        )
+
+
+def pack_smart_device_flags(apps, schema_editor):
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    for value in range(1, 8):
+        filters = {
+            field: bool(value & flag) for field, flag in SMART_DEVICE_FLAGS.items()
+        }
+        TechnologyAccess.objects.filter(**filters).update(smart_device_flags=value)
+
+
+def unpack_smart_device_flags(apps, schema_editor):
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    for field, flag in SMART_DEVICE_FLAGS.items():
+        TechnologyAccess.objects.filter(
+            smart_device_flags__in=_values_with(flag)
+        ).update(**{field: True})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_digital_access_rollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_field_widths, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='technologyaccess',
+            name='smart_device_flags',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(pack_smart_device_flags, unpack_smart_device_flags),
+        migrations.RemoveField(
+            model_name='technologyaccess',
+            name='has_smart_speaker',
+        ),
+        migrations.RemoveField(
+            model_name='technologyaccess',
+            name='has_smart_thermostat',
+        ),
+        migrations.RemoveField(
+            model_name='technologyaccess',
+            name='has_smart_tv',
+        ),
+        migrations.AddConstraint(
+            model_name='technologyaccess',
+            constraint=models.CheckConstraint(check=models.Q(('smart_device_flags__lte', 7)), name='tech_smart_flags_range'),
+        ),
+        migrations.AlterField(
+            model_name='education',
+            name='primary_language',
+            field=models.CharField(default='English', max_length=30),
+        ),
+        migrations.AlterField(
+            model_name='education',
+            name='school_name',
+            field=models.CharField(blank=True, max_length=120, null=True),
+        ),
+        migrations.AlterField(
+            model_name='education',
+            name='school_type',
+            field=models.CharField(blank=True, choices=[('public', 'Public'), ('private', 'Private'), ('charter', 'Charter'), ('homeschool', 'Homeschool'), ('other', 'Other')], max_length=10, null=True),
+        ),
+        migrations.AlterField(
+            model_name='household',
+            name='municipality',
+            field=models.CharField(help_text='Municipality name', max_length=60),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_smart_device_flags_and_field_widths'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(condition=models.Q(('digital_access_index__lt', 0.3)), fields=['digital_access_index'], name='hh_dai_low'),
+        ),
+        migrations.AddIndex(
+            model_name='household',
+            index=models.Index(condition=models.Q(('digital_access_index__gte', 0.8)), fields=['digital_access_index'], name='hh_dai_high'),
+        ),
+        migrations.AddConstraint(
+            model_name='household',
+            constraint=models.CheckConstraint(check=models.Q(('digital_access_index__isnull', True), models.Q(('digital_access_index__gte', 0.0), ('digital_access_index__lte', 1.0)), _connector='OR'), name='hh_dai_range'),
+        ),
+    ]
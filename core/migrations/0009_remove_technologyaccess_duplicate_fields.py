@@ -0,0 +1,143 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:05
+
+from django.db import migrations
+from django.db.models import Case, Exists, F, FloatField, OuterRef, Value, When
+from django.db.models.functions import Cast, Least
+
+# Rows processed per batch. Kept below SQLite's default limit of 999
+# bound parameters for the pk__in filters.
+CHUNK_SIZE = 500
+
+# Frozen copies of the internet score table and Digital Access Index
+# expression from core.models.household as of this migration
+INTERNET_SCORES = {
+    'NONE': 0,
+    'MOB': 2,
+    'ADSL': 3,
+    'FIBER': 4,
+    'SAT': 3
+}
+
+DIGITAL_ACCESS_INDEX_EXPRESSION = (
+    Case(
+        *[When(internet_type=internet_type, then=Value(score / 4))
+          for internet_type, score in INTERNET_SCORES.items()],
+        default=Value(0.0)
+    ) * Value(0.4) +
+    Least(
+        Cast(F('number_of_computers') + F('number_of_smartphones'), FloatField()) /
+        F('household_size'),
+        Value(1.0)
+    ) * Value(0.3) +
+    Case(
+        When(has_electricity=True, then=Value(1.0)),
+        default=Value(0.0)
+    ) * Value(0.3)
+)
+
+HOUSEHOLD_FIELDS = [
+    'has_internet', 'internet_type', 'number_of_smartphones', 'number_of_computers'
+]
+TECHNOLOGY_FIELDS = [
+    'has_internet', 'internet_type', 'num_smartphones', 'num_computers'
+]
+
+
+def _chunks(TechnologyAccess):
+    """
+    Yield TechnologyAccess records with their household in pk-ordered
+    batches of CHUNK_SIZE, so memory stays bounded and no cursor is held
+    open while the batch is written back.
+    """
+    last_pk = 0
+    while True:
+        chunk = list(
+            TechnologyAccess.objects.select_related('household')
+            .filter(pk__gt=last_pk).order_by('pk')[:CHUNK_SIZE]
+        )
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1].pk
+
+
+def merge_into_household(apps, schema_editor):
+    """
+    Fold the duplicate TechnologyAccess values into the related Household.
+
+    Household stays the source of truth: TechnologyAccess values only fill
+    in what the household record is missing (no internet recorded, or a
+    lower device count).
+    """
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    Household = apps.get_model('core', 'Household')
+    Person = apps.get_model('core', 'Person')
+
+    for chunk in _chunks(TechnologyAccess):
+        changed = []
+        for technology in chunk:
+            household = technology.household
+            merged = (
+                household.has_internet or technology.has_internet,
+                technology.internet_type if household.internet_type == 'NONE'
+                else household.internet_type,
+                max(household.number_of_smartphones, technology.num_smartphones),
+                max(household.number_of_computers, technology.num_computers),
+            )
+            if merged != tuple(getattr(household, name) for name in HOUSEHOLD_FIELDS):
+                for name, value in zip(HOUSEHOLD_FIELDS, merged):
+                    setattr(household, name, value)
+                changed.append(household)
+        if not changed:
+            continue
+
+        Household.objects.bulk_update(changed, HOUSEHOLD_FIELDS)
+
+        # Keep derived data in step with the merged values
+        changed_ids = [household.pk for household in changed]
+        Household.objects.filter(pk__in=changed_ids).update(
+            digital_access_index=DIGITAL_ACCESS_INDEX_EXPRESSION
+        )
+        # Frozen copy of PersonQuerySet.sync_household_internet()
+        Person.objects.filter(household__in=changed_ids).update(
+            household_has_internet=Exists(Household.objects.filter(
+                pk=OuterRef('household_id'), has_internet=True
+            ))
+        )
+
+
+def copy_from_household(apps, schema_editor):
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    for chunk in _chunks(TechnologyAccess):
+        for technology in chunk:
+            household = technology.household
+            for technology_name, household_name in zip(TECHNOLOGY_FIELDS, HOUSEHOLD_FIELDS):
+                setattr(technology, technology_name, getattr(household, household_name))
+        TechnologyAccess.objects.bulk_update(chunk, TECHNOLOGY_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_digital_access_index_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_into_household, copy_from_household),
+        migrations.RemoveField(
+            model_name='technologyaccess',
+            name='has_internet',
+        ),
+        migrations.RemoveField(
+            model_name='technologyaccess',
+            name='internet_type',
+        ),
+        migrations.RemoveField(
+            model_name='technologyaccess',
+            name='num_computers',
+        ),
+        migrations.RemoveField(
+            model_name='technologyaccess',
+            name='num_smartphones',
+        ),
+    ]
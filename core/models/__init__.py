@@ -0,0 +1,5 @@
+from .household import Household
+from .person import Person
+from .technology import TechnologyAccess
+from .education import Education
+from .rollup import DigitalAccessRollup
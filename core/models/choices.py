@@ -0,0 +1,17 @@
+"""
+choices.py - Shared field choices for Digital Divide Analysis System models
+
+Choices used by more than one model are defined here so that related
+columns store the same values and can be compared or joined directly.
+"""
+
+# Internet connection types, used by Household and TechnologyAccess
+INTERNET_TYPE_CHOICES = [
+    ('NONE', 'No Internet'),
+    ('FIBER', 'Fiber'),
+    ('ADSL', 'ADSL'),
+    ('MOB', 'Mobile Data'),
+    ('SAT', 'Satellite'),
+    ('DIAL', 'Dial-up'),
+    ('OTHER', 'Other'),
+]
@@ -1,6 +1,41 @@
 from django.db import models
 from .person import Person
 
+# Columns loaded by EducationManager.slim_with_person(): enough for __str__
+# and get_academic_status() plus the person's key details. person__household
+# keeps the household foreign key loaded for later joins or prefetches.
+_LISTING_FIELDS = (
+    'person',
+    'current_education_level',
+    'is_currently_enrolled',
+    'school_name',
+    'person__person_id',
+    'person__household',
+    'person__age',
+    'person__education_level',
+)
+
+
+class EducationManager(models.Manager):
+    """
+    Manager providing optimised querysets for Education records.
+    """
+
+    def with_person(self):
+        """
+        Return Education records with the related Person joined in, so that
+        listings reading person details do not issue a query per row.
+        """
+        return self.get_queryset().select_related('person')
+
+    def slim_with_person(self):
+        """
+        Return with_person() limited to the columns listings need
+        (see _LISTING_FIELDS), reducing row width on both tables.
+        """
+        return self.with_person().only(*_LISTING_FIELDS)
+
+
 class Education(models.Model):
     """
     Model to track individual-level education metrics and history.
@@ -11,32 +46,31 @@ class Education(models.Model):
         related_name='education'
     )
 
-    # Current Education Status
-    EDUCATION_LEVEL_CHOICES = [
-        ('none', 'No Formal Education'),
-        ('primary', 'Primary School'),
-        ('secondary', 'Secondary School'),
-        ('high_school', 'High School'),
-        ('vocational', 'Vocational Training'),
-        ('associates', 'Associate\'s Degree'),
-        ('bachelors', 'Bachelor\'s Degree'),
-        ('masters', 'Master\'s Degree'),
-        ('doctorate', 'Doctorate'),
-        ('other', 'Other')
-    ]
-
-    current_education_level = models.CharField(
-        max_length=50,
-        choices=EDUCATION_LEVEL_CHOICES,
-        default='none'
+    # Current Education Status, stored as its level score (0-8, with Other
+    # as 9) so that level comparisons are plain integer comparisons
+    class EducationLevel(models.IntegerChoices):
+        NONE = 0, 'No Formal Education'
+        PRIMARY = 1, 'Primary School'
+        SECONDARY = 2, 'Secondary School'
+        HIGH_SCHOOL = 3, 'High School'
+        VOCATIONAL = 4, 'Vocational Training'
+        ASSOCIATES = 5, 'Associate\'s Degree'
+        BACHELORS = 6, 'Bachelor\'s Degree'
+        MASTERS = 7, 'Master\'s Degree'
+        DOCTORATE = 8, 'Doctorate'
+        OTHER = 9, 'Other'
+
+    current_education_level = models.PositiveSmallIntegerField(
+        choices=EducationLevel.choices,
+        default=EducationLevel.NONE
     )
 
     is_currently_enrolled = models.BooleanField(default=False)
 
     # School Information
-    school_name = models.CharField(max_length=200, blank=True, null=True)
+    school_name = models.CharField(max_length=120, blank=True, null=True)
     school_type = models.CharField(
-        max_length=50,
+        max_length=10,
         choices=[
             ('public', 'Public'),
             ('private', 'Private'),
@@ -54,7 +88,7 @@ class Education(models.Model):
     # Additional Educational Metrics
     years_of_education = models.PositiveIntegerField(default=0)
     has_special_education = models.BooleanField(default=False)
-    primary_language = models.CharField(max_length=50, default='English')
+    primary_language = models.CharField(max_length=30, default='English')
     is_bilingual = models.BooleanField(default=False)
 
     # Scholarships and Financial Aid
@@ -77,42 +111,36 @@ class Education(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EducationManager()
+
     class Meta:
         verbose_name_plural = "Education"
         db_table = 'education'
 
     def __str__(self):
-        return f"Education Record for {self.person.full_name}"
+        return f"Education Record for Person {self.person_id}"
 
     def get_education_level_score(self):
         """
         Calculate education level score (0-8).
         """
-        level_scores = {
-            'none': 0,
-            'primary': 1,
-            'secondary': 2,
-            'high_school': 3,
-            'vocational': 4,
-            'associates': 5,
-            'bachelors': 6,
-            'masters': 7,
-            'doctorate': 8
-        }
-        return level_scores.get(self.current_education_level, 0)
+        if self.current_education_level == self.EducationLevel.OTHER:
+            return 0
+        return int(self.current_education_level)
 
     def is_higher_education(self):
         """
         Check if the person is in or has completed higher education.
         """
-        higher_ed_levels = ['associates', 'bachelors', 'masters', 'doctorate']
-        return self.current_education_level in higher_ed_levels
+        return (self.EducationLevel.ASSOCIATES <=
+                self.current_education_level <=
+                self.EducationLevel.DOCTORATE)
 
     def get_academic_status(self):
         """
         Return a summary of the person's academic status.
         """
-        status = f"Level: {self.get_education_level_display()}"
+        status = f"Level: {self.get_current_education_level_display()}"
         if self.is_currently_enrolled:
             status += " (Currently Enrolled)"
         if self.school_name:
@@ -12,9 +12,117 @@ World Bank. "Digital Access Index Methodology." World Bank Group, 2020,
 documents.worldbank.org/digital-development/methodology
 """
 
+import numpy as np
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db.models import Case, F, FloatField, Value, When
+from django.db.models.functions import Cast, Least
 from django.utils.translation import gettext_lazy as _
+from .choices import INTERNET_TYPE_CHOICES
+
+# Internet connection scores (0-4 points) used by the Digital Access Index
+_INTERNET_SCORES = {
+    'NONE': 0,
+    'MOB': 2,
+    'ADSL': 3,
+    'FIBER': 4,
+    'SAT': 3
+}
+
+# Fields the Digital Access Index is derived from
+_DAI_INPUT_FIELDS = (
+    'internet_type',
+    'number_of_computers',
+    'number_of_smartphones',
+    'household_size',
+    'has_electricity',
+)
+
+# Database-side equivalent of Household.calculate_digital_access_index(),
+# used to recalculate the index for many rows in a single UPDATE
+DIGITAL_ACCESS_INDEX_EXPRESSION = (
+    Case(
+        *[When(internet_type=internet_type, then=Value(score / 4))
+          for internet_type, score in _INTERNET_SCORES.items()],
+        default=Value(0.0)
+    ) * Value(0.4) +
+    Least(
+        Cast(F('number_of_computers') + F('number_of_smartphones'), FloatField()) /
+        F('household_size'),
+        Value(1.0)
+    ) * Value(0.3) +
+    Case(
+        When(has_electricity=True, then=Value(1.0)),
+        default=Value(0.0)
+    ) * Value(0.3)
+)
+
+# Columns loaded by HouseholdManager.slim_for_dashboard(), including those
+# read by __str__. Serializers built on that queryset must only read these
+# fields, or each access to a deferred field costs an extra query per row.
+_DASHBOARD_FIELDS = (
+    'household_id',
+    'province',
+    'municipality',
+    'area_type',
+    'has_internet',
+    'internet_type',
+    'digital_access_index',
+)
+
+
+class HouseholdQuerySet(models.QuerySet):
+    """
+    QuerySet providing optimised, chainable access to Household records.
+    """
+
+    def with_members(self):
+        """
+        Return households with their members prefetched, fetching all
+        members in a single additional query instead of one per household.
+        """
+        return self.prefetch_related('household_members')
+
+    def slim_for_dashboard(self):
+        """
+        Return households with only the columns dashboard listings need
+        loaded (see _DASHBOARD_FIELDS), reducing row width.
+        """
+        return self.only(*_DASHBOARD_FIELDS)
+
+    def stream(self, chunk_size=2000):
+        """
+        Iterate over the households in chunks, without caching the full
+        result set in memory.
+
+        Filter in the database before streaming, e.g.
+        Household.objects.filter(has_internet=True).stream(), rather than
+        skipping rows in Python. Prefer select_related() over
+        prefetch_related() here, as prefetching runs one extra query per
+        chunk.
+
+        Args:
+            chunk_size: Number of rows fetched from the database at a time
+
+        Returns:
+            iterator: Household instances
+        """
+        return self.iterator(chunk_size=chunk_size)
+
+    def refresh_digital_access_index(self):
+        """
+        Recalculate the Digital Access Index of every household in the
+        queryset inside the database with one UPDATE, without loading or
+        saving each record, e.g.
+        Household.objects.filter(province='GP').refresh_digital_access_index().
+
+        Returns:
+            int: Number of households updated
+        """
+        return self.update(digital_access_index=DIGITAL_ACCESS_INDEX_EXPRESSION)
+
+
+HouseholdManager = models.Manager.from_queryset(HouseholdQuerySet)
 
 
 class Household(models.Model):
@@ -57,7 +165,7 @@ class Household(models.Model):
     )
 
     municipality = models.CharField(
-        max_length=100,
+        max_length=60,
         help_text=_("Municipality name")
     )
 
@@ -92,13 +200,9 @@ class Household(models.Model):
         help_text=_("Whether the household has internet access")
     )
 
-    INTERNET_TYPE_CHOICES = [
-        ('NONE', 'No Internet'),
-        ('FIBER', 'Fiber'),
-        ('ADSL', 'ADSL'),
-        ('MOB', 'Mobile Data'),
-        ('SAT', 'Satellite'),
-    ]
+    # Shared with TechnologyAccess (see choices.py); kept as a class
+    # attribute so that Household.INTERNET_TYPE_CHOICES still resolves
+    INTERNET_TYPE_CHOICES = INTERNET_TYPE_CHOICES
 
     internet_type = models.CharField(
         max_length=5,
@@ -136,6 +240,8 @@ class Household(models.Model):
         help_text=_("Timestamp when the record was last updated")
     )
 
+    objects = HouseholdManager()
+
     class Meta:
         """
         Meta class for additional model configurations
@@ -144,8 +250,38 @@ class Household(models.Model):
         verbose_name_plural = _("Households")
         ordering = ['province', 'municipality']
         indexes = [
-            models.Index(fields=['province', 'area_type']),
             models.Index(fields=['digital_access_index']),
+            models.Index(fields=['province', 'area_type', 'has_internet']),
+            models.Index(fields=['internet_type', 'province']),
+            models.Index(
+                fields=['province'],
+                condition=models.Q(has_internet=True),
+                name='hh_prov_haveint'
+            ),
+            # Partial indexes for the digitally unserved and well-served
+            # cohorts, much smaller than the full index above
+            models.Index(
+                fields=['digital_access_index'],
+                condition=models.Q(digital_access_index__lt=0.3),
+                name='hh_dai_low'
+            ),
+            models.Index(
+                fields=['digital_access_index'],
+                condition=models.Q(digital_access_index__gte=0.8),
+                name='hh_dai_high'
+            ),
+        ]
+        constraints = [
+            # Mirrors the field validators so the range holds for every
+            # write path, and the query planner can rely on it
+            models.CheckConstraint(
+                check=(
+                    models.Q(digital_access_index__isnull=True) |
+                    models.Q(digital_access_index__gte=0.0,
+                             digital_access_index__lte=1.0)
+                ),
+                name='hh_dai_range'
+            ),
         ]
 
     def __str__(self):
@@ -166,15 +302,15 @@ class Household(models.Model):
         Returns:
             float: Digital Access Index score between 0 and 1
         """
+        # Reuse the previous result while the inputs are unchanged
+        inputs = self._get_dai_inputs()
+        cached = getattr(self, '_dai_cache', None)
+        if cached is not None and cached[0] == inputs:
+            self.digital_access_index = cached[1]
+            return self.digital_access_index
+
         # Internet score (0-4 points)
-        internet_scores = {
-            'NONE': 0,
-            'MOB': 2,
-            'ADSL': 3,
-            'FIBER': 4,
-            'SAT': 3
-        }
-        internet_score = internet_scores.get(self.internet_type, 0) / 4
+        internet_score = _INTERNET_SCORES.get(self.internet_type, 0) / 4
 
         # Device score (0-1 points)
         devices_per_person = (self.number_of_computers + 
@@ -190,11 +326,101 @@ class Household(models.Model):
             (device_score * 0.3) +
             (infrastructure_score * 0.3)
         )
+        self._dai_cache = (inputs, self.digital_access_index)
         return self.digital_access_index
 
+    @classmethod
+    def bulk_create_with_dai(cls, objs, batch_size=1000):
+        """
+        Bulk insert households, calculating their Digital Access Index in a
+        single vectorised pass instead of once per record in save().
+
+        Uses the same weighting as calculate_digital_access_index().
+        created_at and updated_at need not be set beforehand: bulk_create()
+        runs the auto_now/auto_now_add hooks for each row, and would
+        overwrite any value assigned here. Members later added with
+        Person.objects.bulk_create() need
+        Person.objects.filter(...).sync_household_internet() to pick up
+        the household's internet access.
+
+        Args:
+            objs: Iterable of unsaved Household instances
+            batch_size: Number of records per INSERT statement
+
+        Returns:
+            list: The created Household instances
+        """
+        objs = list(objs)
+        if not objs:
+            return objs
+
+        internet_type = np.array([obj.internet_type for obj in objs])
+        internet_score = np.select(
+            [internet_type == value for value in _INTERNET_SCORES],
+            list(_INTERNET_SCORES.values()),
+            default=0
+        ) / 4
+
+        devices = np.array(
+            [obj.number_of_computers + obj.number_of_smartphones for obj in objs],
+            dtype=float
+        )
+        household_size = np.array([obj.household_size for obj in objs], dtype=float)
+        device_score = np.minimum(devices / household_size, 1.0)
+
+        infrastructure_score = np.array(
+            [obj.has_electricity for obj in objs], dtype=float
+        )
+
+        indexes = (
+            (internet_score * 0.4) +
+            (device_score * 0.3) +
+            (infrastructure_score * 0.3)
+        )
+        for obj, index in zip(objs, indexes.tolist()):
+            obj.digital_access_index = index
+
+        return cls.objects.bulk_create(objs, batch_size=batch_size)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Seed the index cache of loaded records with their stored index, so
+        that save() does not recalculate it while the inputs are unchanged,
+        and remember the loaded internet access so that the post_save
+        signal only updates members when it changes.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'has_internet' in field_names:
+            instance._loaded_has_internet = instance.has_internet
+        if ('digital_access_index' in field_names and
+                instance.digital_access_index is not None and
+                set(_DAI_INPUT_FIELDS).issubset(field_names)):
+            instance._dai_cache = (
+                instance._get_dai_inputs(), instance.digital_access_index
+            )
+        return instance
+
+    def _get_dai_inputs(self):
+        """
+        Return the current values of the fields the index depends on.
+        """
+        return tuple(getattr(self, name) for name in _DAI_INPUT_FIELDS)
+
     def save(self, *args, **kwargs):
         """
-        Override save method to calculate digital access index before saving
+        Override save method to calculate digital access index before saving.
+
+        calculate_digital_access_index() only recalculates the index for new
+        records, or when one of its input fields has changed since the record
+        was loaded. Saves limited by update_fields to non-input fields skip
+        it entirely.
         """
-        self.calculate_digital_access_index()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or not set(update_fields).isdisjoint(_DAI_INPUT_FIELDS):
+            self.calculate_digital_access_index()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'digital_access_index'}
+        super().save(*args, **kwargs)
+        if update_fields is None or 'has_internet' in update_fields:
+            self._loaded_has_internet = self.has_internet
\ No newline at end of file
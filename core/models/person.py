@@ -14,9 +14,114 @@ www.statssa.gov.za/publications/P0318/P03182021.pdf.
 
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db.models import Case, Exists, F, OuterRef, Value, When
+from django.db.models.functions import Least
 from django.utils.translation import gettext_lazy as _
 from .household import Household
 
+# Fields the digital literacy score is derived from
+_LITERACY_INPUT_FIELDS = (
+    'has_own_device',
+    'internet_usage_hours',
+    'uses_internet_for_education',
+)
+
+# Database-side equivalent of Person.calculate_digital_literacy_score(),
+# used to recalculate the score for many rows in a single UPDATE
+DIGITAL_LITERACY_SCORE_EXPRESSION = (
+    Case(
+        When(has_own_device=True, then=Value(0.3)),
+        default=Value(0.0)
+    ) +
+    Least(F('internet_usage_hours') / Value(8.0), Value(1.0)) * Value(0.4) +
+    Case(
+        When(uses_internet_for_education=True, then=Value(0.3)),
+        default=Value(0.0)
+    )
+)
+
+# Columns loaded by PersonManager.slim_for_listing(): enough for listings
+# and has_digital_access. household_id is included so that household
+# lookups and prefetches can still be joined without a query per row.
+_LISTING_FIELDS = (
+    'person_id',
+    'household_id',
+    'age',
+    'gender',
+    'education_level',
+    'currently_studying',
+    'has_own_device',
+    'internet_usage_hours',
+    'household_has_internet',
+    'digital_literacy_score',
+)
+
+
+class PersonQuerySet(models.QuerySet):
+    """
+    QuerySet providing optimised, chainable access to Person records.
+    """
+
+    def with_household(self):
+        """
+        Return people with their household joined in, so that accessing
+        the household does not query per row.
+        """
+        return self.select_related('household')
+
+    def slim_for_listing(self):
+        """
+        Return people with only the columns listings need loaded
+        (see _LISTING_FIELDS), reducing row width.
+        """
+        return self.only(*_LISTING_FIELDS)
+
+    def stream(self, chunk_size=2000):
+        """
+        Iterate over the people in chunks, without caching the full result
+        set in memory.
+
+        As with HouseholdQuerySet.stream(), filter in the database first
+        and prefer select_related('household') over prefetching.
+
+        Args:
+            chunk_size: Number of rows fetched from the database at a time
+
+        Returns:
+            iterator: Person instances
+        """
+        return self.iterator(chunk_size=chunk_size)
+
+    def refresh_digital_literacy_score(self):
+        """
+        Recalculate the digital literacy score of every person in the
+        queryset inside the database with one UPDATE, without loading or
+        saving each record.
+
+        Returns:
+            int: Number of people updated
+        """
+        return self.update(digital_literacy_score=DIGITAL_LITERACY_SCORE_EXPRESSION)
+
+    def sync_household_internet(self):
+        """
+        Recopy household.has_internet into household_has_internet for every
+        person in the queryset with one UPDATE.
+
+        Needed after bulk writes that bypass Person.save() and the Household
+        post_save signal: Household QuerySet.update() or bulk_update(), and
+        Person bulk_create(), which leaves the flag at its default.
+
+        Returns:
+            int: Number of people updated
+        """
+        return self.update(household_has_internet=Exists(
+            Household.objects.filter(pk=OuterRef('household_id'), has_internet=True)
+        ))
+
+
+PersonManager = models.Manager.from_queryset(PersonQuerySet)
+
 
 class Person(models.Model):
     """
@@ -24,16 +129,16 @@ class Person(models.Model):
     demographic information, educational status, and technology usage patterns.
     """
 
-    # Educational level choices based on South African education system
-    EDUCATION_LEVEL_CHOICES = [
-        ('NONE', 'No Formal Education'),
-        ('PRIM', 'Primary School'),
-        ('SECO', 'Secondary School'),
-        ('MATR', 'Matric Completed'),
-        ('DIPL', 'Diploma/Certificate'),
-        ('DEGR', 'University Degree'),
-        ('POST', 'Postgraduate Degree'),
-    ]
+    # Educational level choices based on South African education system,
+    # stored as integers in ascending order of attainment
+    class EducationLevel(models.IntegerChoices):
+        NONE = 0, 'No Formal Education'
+        PRIMARY = 1, 'Primary School'
+        SECONDARY = 2, 'Secondary School'
+        MATRIC = 3, 'Matric Completed'
+        DIPLOMA = 4, 'Diploma/Certificate'
+        DEGREE = 5, 'University Degree'
+        POSTGRADUATE = 6, 'Postgraduate Degree'
 
     SCHOOL_TYPE_CHOICES = [
         ('PUB', 'Public School'),
@@ -70,9 +175,8 @@ class Person(models.Model):
     )
 
     # Educational Information
-    education_level = models.CharField(
-        max_length=4,
-        choices=EDUCATION_LEVEL_CHOICES,
+    education_level = models.PositiveSmallIntegerField(
+        choices=EducationLevel.choices,
         help_text=_("Highest level of education completed")
     )
 
@@ -112,6 +216,13 @@ class Person(models.Model):
         help_text=_("Whether internet is used for educational purposes")
     )
 
+    # Copy of household.has_internet, kept in sync by save() and the
+    # Household post_save signal so that access checks need no join
+    household_has_internet = models.BooleanField(
+        default=False,
+        help_text=_("Whether the person's household has internet access")
+    )
+
     # Educational Performance (for students)
     average_academic_score = models.FloatField(
         validators=[MinValueValidator(0.0), MaxValueValidator(100.0)],
@@ -139,6 +250,8 @@ class Person(models.Model):
         help_text=_("Timestamp when the record was last updated")
     )
 
+    objects = PersonManager()
+
     class Meta:
         """
         Meta class for additional model configurations
@@ -150,6 +263,7 @@ class Person(models.Model):
             models.Index(fields=['household', 'education_level']),
             models.Index(fields=['digital_literacy_score']),
             models.Index(fields=['age', 'education_level']),
+            models.Index(fields=['household', 'currently_studying', 'education_level']),
         ]
 
     def __str__(self):
@@ -166,6 +280,13 @@ class Person(models.Model):
         Returns:
             float: Digital literacy score between 0 and 1
         """
+        # Reuse the previous result while the inputs are unchanged
+        inputs = self._get_literacy_inputs()
+        cached = getattr(self, '_literacy_cache', None)
+        if cached is not None and cached[0] == inputs:
+            self.digital_literacy_score = cached[1]
+            return self.digital_literacy_score
+
         # Base score from device ownership (0-0.3)
         device_score = 0.3 if self.has_own_device else 0.0
 
@@ -177,14 +298,69 @@ class Person(models.Model):
 
         # Calculate total score
         self.digital_literacy_score = device_score + usage_score + edu_tech_score
+        self._literacy_cache = (inputs, self.digital_literacy_score)
         return self.digital_literacy_score
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Seed the score cache of loaded records with their stored score, so
+        that save() does not recalculate it while the inputs are unchanged,
+        and remember the loaded household so that save() can detect moves.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'household_id' in field_names:
+            instance._loaded_household_id = instance.household_id
+        if ('digital_literacy_score' in field_names and
+                instance.digital_literacy_score is not None and
+                set(_LITERACY_INPUT_FIELDS).issubset(field_names)):
+            instance._literacy_cache = (
+                instance._get_literacy_inputs(), instance.digital_literacy_score
+            )
+        return instance
+
+    def _get_literacy_inputs(self):
+        """
+        Return the current values of the fields the score depends on.
+        """
+        return tuple(getattr(self, name) for name in _LITERACY_INPUT_FIELDS)
+
     def save(self, *args, **kwargs):
         """
-        Override save method to calculate digital literacy score before saving
+        Override save method to calculate digital literacy score before saving.
+
+        calculate_digital_literacy_score() only recalculates the score for new
+        records, or when one of its input fields has changed since the record
+        was loaded. Saves limited by update_fields to non-input fields skip
+        it entirely.
+
+        The denormalised household_has_internet flag is copied from the
+        household when the person is created or moves household. Assigning
+        the household by id, e.g. Person.objects.create(household_id=...),
+        costs an extra SELECT to load it; pass the Household instance where
+        one is at hand.
         """
-        self.calculate_digital_literacy_score()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+
+        if update_fields is None or not update_fields.isdisjoint(_LITERACY_INPUT_FIELDS):
+            self.calculate_digital_literacy_score()
+            if update_fields is not None:
+                update_fields.add('digital_literacy_score')
+
+        if update_fields is None or not update_fields.isdisjoint({'household', 'household_id'}):
+            if (self._state.adding or
+                    self.household_id != getattr(self, '_loaded_household_id', None)):
+                self.household_has_internet = self.household.has_internet
+                if update_fields is not None:
+                    update_fields.add('household_has_internet')
+
+        if update_fields is not None:
+            kwargs['update_fields'] = update_fields
         super().save(*args, **kwargs)
+        if update_fields is None or not update_fields.isdisjoint({'household', 'household_id'}):
+            self._loaded_household_id = self.household_id
 
     @property
     def is_student(self):
@@ -198,6 +374,6 @@ class Person(models.Model):
         """
         Determines if the person has adequate digital access
         """
-        return (self.has_own_device and 
-                self.household.has_internet and 
+        return (self.has_own_device and
+                self.household_has_internet and
                 self.internet_usage_hours > 0)
\ No newline at end of file
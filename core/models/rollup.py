@@ -0,0 +1,106 @@
+"""
+rollup.py - Digital Access Rollup Model for Digital Divide Analysis System
+
+This module defines the DigitalAccessRollup model, a precomputed summary of
+household digital access per province and area type. Dashboards read this
+small table instead of aggregating the full household table on every request.
+"""
+
+from django.db import models, transaction
+from django.db.models import Avg, Count, Sum
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from .household import Household
+
+
+class DigitalAccessRollupManager(models.Manager):
+    """
+    Manager for rebuilding the precomputed rollup rows.
+    """
+
+    def refresh(self):
+        """
+        Rebuild the rollup from the current households using a single
+        aggregate query, replacing all existing rows atomically.
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        # order_by() clears Household's default ordering, which would
+        # otherwise be added to the GROUP BY
+        totals = (
+            Household.objects.order_by()
+            .values('province', 'area_type')
+            .annotate(
+                household_count=Count('household_id'),
+                mean_digital_access_index=Avg('digital_access_index'),
+                total_computers=Sum('number_of_computers'),
+            )
+        )
+        refreshed_at = timezone.now()
+        rollups = [self.model(refreshed_at=refreshed_at, **row) for row in totals]
+
+        with transaction.atomic():
+            self.get_queryset().delete()
+            self.bulk_create(rollups)
+        return len(rollups)
+
+
+class DigitalAccessRollup(models.Model):
+    """
+    Household count, mean Digital Access Index and computer ownership for
+    one province and area type, as of the last refresh.
+    """
+
+    province = models.CharField(
+        max_length=3,
+        choices=Household.PROVINCE_CHOICES,
+        help_text=_("Province the totals cover")
+    )
+
+    area_type = models.CharField(
+        max_length=3,
+        choices=Household.AREA_TYPE_CHOICES,
+        help_text=_("Type of settlement area the totals cover")
+    )
+
+    household_count = models.PositiveIntegerField(
+        help_text=_("Number of households")
+    )
+
+    mean_digital_access_index = models.FloatField(
+        null=True,
+        blank=True,
+        help_text=_("Mean Digital Access Index of the households")
+    )
+
+    total_computers = models.PositiveIntegerField(
+        help_text=_("Total number of computers/laptops in the households")
+    )
+
+    refreshed_at = models.DateTimeField(
+        help_text=_("Timestamp when the totals were last recalculated")
+    )
+
+    objects = DigitalAccessRollupManager()
+
+    class Meta:
+        """
+        Meta class for additional model configurations
+        """
+        verbose_name = _("Digital Access Rollup")
+        verbose_name_plural = _("Digital Access Rollups")
+        db_table = 'digital_access_rollup'
+        ordering = ['province', 'area_type']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['province', 'area_type'],
+                name='rollup_province_area_unique'
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the DigitalAccessRollup model
+        """
+        return f"Rollup {self.province} {self.area_type} ({self.household_count} households)"
@@ -1,9 +1,76 @@
+import numpy as np
 from django.db import models
+from django.db.models import F
 from .household import Household
 
+# Internet connection types that earn the fast-connection bonus
+_FAST_INTERNET = frozenset({'FIBER', 'ADSL'})
+
+
+def _smart_device_property(flag):
+    """
+    Build a boolean property reading and writing one bit of
+    smart_device_flags, so the flags behave like individual fields.
+    """
+    def getter(self):
+        return bool(self.smart_device_flags & flag)
+
+    def setter(self, value):
+        if value:
+            self.smart_device_flags |= flag
+        else:
+            self.smart_device_flags &= ~flag
+
+    return property(getter, setter)
+
+
+class TechnologyAccessQuerySet(models.QuerySet):
+    """
+    QuerySet providing chainable filters on TechnologyAccess records.
+    """
+
+    def with_smart_devices(self, *flags):
+        """
+        Return records with every given smart device flag set, or with any
+        smart device when no flags are given, e.g.
+        TechnologyAccess.objects.with_smart_devices(TechnologyAccess.SMART_TV)
+        in place of the former filter(has_smart_tv=True).
+
+        The flags are packed into smart_device_flags, so the filter matches
+        the flag values containing all the requested bits.
+        """
+        required = 0
+        for flag in flags:
+            required |= flag
+        mask = self.model._SMART_DEVICE_MASK
+        return self.filter(smart_device_flags__in=[
+            value for value in range(1, mask + 1) if value & required == required
+        ])
+
+
+class TechnologyAccessManager(models.Manager.from_queryset(TechnologyAccessQuerySet)):
+    """
+    Manager joining in the related household, which holds the core
+    internet and device fields, and annotating each record with its total
+    device count. The count is computed by the database so it can be
+    filtered, ordered and aggregated on (e.g. filter(total_devices__gte=3))
+    without a Python pass.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('household').annotate(
+            total_devices=(
+                F('household__number_of_smartphones') +
+                F('household__number_of_computers') +
+                F('num_tablets')
+            )
+        )
+
+
 class TechnologyAccess(models.Model):
     """
-    Model to track household-level technology ownership and internet access.
+    Model to track household-level technology ownership beyond the core
+    internet and device fields stored on Household.
     """
     household = models.OneToOneField(
         Household,
@@ -11,31 +78,23 @@ class TechnologyAccess(models.Model):
         related_name='technology_access'
     )
 
-    # Internet Access
-    has_internet = models.BooleanField(default=False)
-    internet_type = models.CharField(
-        max_length=50,
-        choices=[
-            ('none', 'No Internet'),
-            ('broadband', 'Broadband'),
-            ('mobile', 'Mobile Data'),
-            ('satellite', 'Satellite'),
-            ('dial_up', 'Dial-up'),
-            ('other', 'Other')
-        ],
-        default='none'
-    )
+    # Internet Access (access and type are stored on Household)
     internet_speed_mbps = models.FloatField(null=True, blank=True)
 
-    # Device Ownership
-    num_smartphones = models.PositiveIntegerField(default=0)
-    num_computers = models.PositiveIntegerField(default=0)
+    # Device Ownership (smartphones and computers are stored on Household)
     num_tablets = models.PositiveIntegerField(default=0)
 
-    # Smart Home Devices
-    has_smart_tv = models.BooleanField(default=False)
-    has_smart_speaker = models.BooleanField(default=False)
-    has_smart_thermostat = models.BooleanField(default=False)
+    # Smart Home Devices, packed into one bitmask column
+    SMART_TV = 1
+    SMART_SPEAKER = 2
+    SMART_THERMOSTAT = 4
+    _SMART_DEVICE_MASK = SMART_TV | SMART_SPEAKER | SMART_THERMOSTAT
+
+    smart_device_flags = models.PositiveSmallIntegerField(default=0)
+
+    has_smart_tv = _smart_device_property(SMART_TV)
+    has_smart_speaker = _smart_device_property(SMART_SPEAKER)
+    has_smart_thermostat = _smart_device_property(SMART_THERMOSTAT)
 
     # Additional Technology
     has_gaming_console = models.BooleanField(default=False)
@@ -45,28 +104,40 @@ class TechnologyAccess(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TechnologyAccessManager()
+
     class Meta:
         verbose_name_plural = "Technology Access"
         db_table = 'technology_access'
+        constraints = [
+            # Only the three smart device bits may be set
+            models.CheckConstraint(
+                check=models.Q(smart_device_flags__lte=7),
+                name='tech_smart_flags_range'
+            ),
+        ]
 
     def __str__(self):
-        return f"Technology Access for Household {self.household.id}"
+        return f"Technology Access for Household {self.household_id}"
 
     def get_total_devices(self):
         """
         Calculate the total number of digital devices in the household.
+
+        Computed from the current field values rather than the
+        total_devices annotation, which would be stale after any of the
+        counts are changed on the instance.
         """
-        return self.num_smartphones + self.num_computers + self.num_tablets
+        household = self.household
+        return (household.number_of_smartphones +
+                household.number_of_computers +
+                self.num_tablets)
 
     def has_any_smart_devices(self):
         """
         Check if the household has any smart home devices.
         """
-        return any([
-            self.has_smart_tv,
-            self.has_smart_speaker,
-            self.has_smart_thermostat
-        ])
+        return bool(self.smart_device_flags & self._SMART_DEVICE_MASK)
 
     def get_technology_score(self):
         """
@@ -75,9 +146,9 @@ class TechnologyAccess(models.Model):
         score = 0
 
         # Internet access (0-3 points)
-        if self.has_internet:
+        if self.household.has_internet:
             score += 2
-            if self.internet_type in ['broadband', 'fiber']:
+            if self.household.internet_type in _FAST_INTERNET:
                 score += 1
 
         # Devices (0-3 points)
@@ -85,18 +156,62 @@ class TechnologyAccess(models.Model):
         score += devices_score
 
         # Smart devices (0-2 points)
-        smart_devices = sum([
-            self.has_smart_tv,
-            self.has_smart_speaker,
-            self.has_smart_thermostat
-        ])
+        smart_devices = (self.has_smart_tv + self.has_smart_speaker +
+                         self.has_smart_thermostat)
         score += min(2, smart_devices)
 
         # Additional technology (0-2 points)
-        additional_tech = sum([
-            self.has_gaming_console,
-            self.has_streaming_service
-        ])
+        additional_tech = self.has_gaming_console + self.has_streaming_service
         score += min(2, additional_tech)
 
-        return round(score, 1)
\ No newline at end of file
+        return round(score, 1)
+
+    @classmethod
+    def bulk_scores(cls, queryset=None):
+        """
+        Calculate get_technology_score() for every record in a queryset
+        with vectorised array operations instead of once per instance.
+
+        Returns a NumPy array of scores in queryset order.
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+        rows = list(queryset.values_list(
+            'household__has_internet',
+            'household__internet_type',
+            'household__number_of_smartphones',
+            'household__number_of_computers',
+            'num_tablets',
+            'smart_device_flags',
+            'has_gaming_console',
+            'has_streaming_service'
+        ))
+        if not rows:
+            return np.zeros(0)
+        columns = list(zip(*rows))
+
+        # Internet access (0-3 points)
+        has_internet = np.array(columns[0], dtype=bool)
+        internet_type = np.array(columns[1])
+        fast_internet = np.isin(internet_type, list(_FAST_INTERNET))
+        internet_score = has_internet * 2 + (has_internet & fast_internet)
+
+        # Devices (0-3 points)
+        total_devices = np.array(columns[2:5], dtype=float).sum(axis=0)
+        devices_score = np.minimum(3, total_devices / 2)
+
+        # Smart devices (0-2 points)
+        smart_device_flags = np.array(columns[5], dtype=int)
+        smart_devices = sum(
+            (smart_device_flags & flag) > 0
+            for flag in (cls.SMART_TV, cls.SMART_SPEAKER, cls.SMART_THERMOSTAT)
+        )
+        smart_score = np.minimum(2, smart_devices)
+
+        # Additional technology (0-2 points)
+        additional_tech = np.array(columns[6:8], dtype=int).sum(axis=0)
+        additional_score = np.minimum(2, additional_tech)
+
+        return np.round(
+            internet_score + devices_score + smart_score + additional_score, 1
+        )
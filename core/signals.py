@@ -0,0 +1,32 @@
+"""
+signals.py - Signal handlers for Digital Divide Analysis System models
+
+Keeps denormalised copies of household data on related records in sync.
+"""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Household, Person
+
+
+@receiver(post_save, sender=Household)
+def sync_member_internet_access(sender, instance, created, update_fields, **kwargs):
+    """
+    Copy a household's internet access onto its members'
+    household_has_internet flag with a single UPDATE, when it has changed
+    since the household was loaded.
+
+    Bulk writes do not send post_save, so after Household QuerySet.update()
+    or bulk_update() callers should run
+    Person.objects.filter(...).sync_household_internet() on the members.
+    """
+    if created:
+        return
+    if update_fields is not None and 'has_internet' not in update_fields:
+        return
+    if getattr(instance, '_loaded_has_internet', None) == instance.has_internet:
+        return
+    Person.objects.filter(household=instance).exclude(
+        household_has_internet=instance.has_internet
+    ).update(household_has_internet=instance.has_internet)
@@ -0,0 +1,196 @@
+"""
+Forward and backward tests for the data migrations in core/migrations.
+"""
+
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+from core.models import Household as CurrentHousehold
+
+
+@pytest.fixture
+def migrate(transactional_db):
+    """
+    Return a function migrating the core app to a given migration and
+    returning the historical apps registry at that point. The schema is
+    migrated back to the latest migration afterwards.
+    """
+    def _migrate(target):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate([('core', target)])
+        return MigrationExecutor(connection).loader.project_state(
+            [('core', target)]
+        ).apps
+
+    yield _migrate
+
+    executor = MigrationExecutor(connection)
+    executor.migrate(executor.loader.graph.leaf_nodes('core'))
+
+
+def _create_household(apps, household_id='H1', **fields):
+    Household = apps.get_model('core', 'Household')
+    values = {
+        'province': 'GP',
+        'municipality': 'Johannesburg',
+        'area_type': 'URB',
+        'household_size': 2,
+    }
+    values.update(fields)
+    return Household.objects.create(household_id=household_id, **values)
+
+
+def _create_person(apps, household, person_id='P1', **fields):
+    Person = apps.get_model('core', 'Person')
+    values = {'age': 20, 'gender': 'F'}
+    values.update(fields)
+    return Person.objects.create(person_id=person_id, household=household, **values)
+
+
+def test_0003_education_levels_to_integers(migrate):
+    apps = migrate('0002_analytics_indexes')
+    person = _create_person(apps, _create_household(apps), education_level='DEGR')
+    apps.get_model('core', 'Education').objects.create(
+        person_id=person.pk, current_education_level='masters'
+    )
+
+    apps = migrate('0003_education_level_integers')
+    assert apps.get_model('core', 'Person').objects.get().education_level == 5
+    assert apps.get_model('core', 'Education').objects.get().current_education_level == 7
+
+    apps = migrate('0002_analytics_indexes')
+    assert apps.get_model('core', 'Person').objects.get().education_level == 'DEGR'
+    assert (apps.get_model('core', 'Education').objects.get().current_education_level ==
+            'masters')
+
+
+def test_0004_shared_internet_type_codes(migrate):
+    apps = migrate('0003_education_level_integers')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    old_codes = ['broadband', 'mobile', 'dial_up']
+    for i, internet_type in enumerate(old_codes):
+        TechnologyAccess.objects.create(
+            household=_create_household(apps, f'H{i}'), internet_type=internet_type
+        )
+
+    apps = migrate('0004_shared_internet_type_choices')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    assert list(TechnologyAccess.objects.order_by('household_id').values_list(
+        'internet_type', flat=True)) == ['ADSL', 'MOB', 'DIAL']
+
+    apps = migrate('0003_education_level_integers')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    assert list(TechnologyAccess.objects.order_by('household_id').values_list(
+        'internet_type', flat=True)) == old_codes
+
+
+def test_0005_populates_household_has_internet(migrate):
+    apps = migrate('0004_shared_internet_type_choices')
+    _create_person(apps, _create_household(apps, 'H1', has_internet=True), 'P1',
+                   education_level=0)
+    _create_person(apps, _create_household(apps, 'H2'), 'P2', education_level=0)
+
+    apps = migrate('0005_person_household_has_internet')
+    Person = apps.get_model('core', 'Person')
+    assert dict(Person.objects.values_list('person_id', 'household_has_internet')) == {
+        'P1': True,
+        'P2': False,
+    }
+
+
+def test_0007_packs_smart_device_flags(migrate):
+    apps = migrate('0006_digital_access_rollup')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    for flags in range(8):
+        TechnologyAccess.objects.create(
+            household=_create_household(apps, f'H{flags}'),
+            has_smart_tv=bool(flags & 1),
+            has_smart_speaker=bool(flags & 2),
+            has_smart_thermostat=bool(flags & 4),
+        )
+
+    apps = migrate('0007_smart_device_flags_and_field_widths')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    assert list(TechnologyAccess.objects.order_by('household_id').values_list(
+        'smart_device_flags', flat=True)) == list(range(8))
+
+    apps = migrate('0006_digital_access_rollup')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    for technology in TechnologyAccess.objects.all():
+        flags = int(technology.household_id[1:])
+        assert technology.has_smart_tv == bool(flags & 1)
+        assert technology.has_smart_speaker == bool(flags & 2)
+        assert technology.has_smart_thermostat == bool(flags & 4)
+
+
+def test_0007_refuses_values_wider_than_new_widths(migrate):
+    apps = migrate('0006_digital_access_rollup')
+    _create_household(apps, 'H1')
+    _create_household(apps, 'H2', municipality='M' * 61)
+
+    with pytest.raises(ValueError, match=r'Household\.municipality \(1 longer .*pk: H2\)'):
+        migrate('0007_smart_device_flags_and_field_widths')
+
+    # Let the fixture migrate forward again
+    apps.get_model('core', 'Household').objects.filter(pk='H2').update(
+        municipality='M' * 60
+    )
+
+
+def test_0009_merges_duplicate_fields_into_household(migrate):
+    apps = migrate('0008_digital_access_index_partial_indexes')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    # Household missing internet: filled in from TechnologyAccess
+    missing = _create_household(apps, 'H1', has_electricity=True,
+                                number_of_smartphones=1, digital_access_index=0.45)
+    _create_person(apps, missing, 'P1', education_level=0)
+    TechnologyAccess.objects.create(household=missing, has_internet=True,
+                                    internet_type='FIBER', num_smartphones=1,
+                                    num_computers=1)
+    # Household already recorded: its values win
+    recorded = _create_household(apps, 'H2', has_internet=True, internet_type='MOB',
+                                 number_of_computers=1, number_of_smartphones=1,
+                                 digital_access_index=0.5)
+    TechnologyAccess.objects.create(household=recorded, internet_type='NONE')
+
+    apps = migrate('0009_remove_technologyaccess_duplicate_fields')
+    Household = apps.get_model('core', 'Household')
+    merged = Household.objects.get(pk='H1')
+    assert (merged.has_internet, merged.internet_type, merged.number_of_computers,
+            merged.number_of_smartphones) == (True, 'FIBER', 1, 1)
+    assert merged.digital_access_index == pytest.approx(CurrentHousehold(
+        household_size=2, has_electricity=True, internet_type='FIBER',
+        number_of_computers=1, number_of_smartphones=1
+    ).calculate_digital_access_index())
+    assert apps.get_model('core', 'Person').objects.get().household_has_internet
+    kept = Household.objects.get(pk='H2')
+    assert (kept.internet_type, kept.digital_access_index) == ('MOB', 0.5)
+
+    apps = migrate('0008_digital_access_index_partial_indexes')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    assert list(TechnologyAccess.objects.order_by('household_id').values_list(
+        'has_internet', 'internet_type', 'num_smartphones', 'num_computers'
+    )) == [(True, 'FIBER', 1, 1), (True, 'MOB', 1, 1)]
+
+
+def test_0009_processes_every_chunk(migrate):
+    apps = migrate('0008_digital_access_index_partial_indexes')
+    Household = apps.get_model('core', 'Household')
+    TechnologyAccess = apps.get_model('core', 'TechnologyAccess')
+    # More rows than the migration's batch size of 500
+    households = Household.objects.bulk_create([
+        Household(household_id=f'H{i}', province='GP', municipality='Johannesburg',
+                  area_type='URB', household_size=1)
+        for i in range(1100)
+    ])
+    TechnologyAccess.objects.bulk_create([
+        TechnologyAccess(household=household, has_internet=True, internet_type='MOB')
+        for household in households
+    ])
+
+    apps = migrate('0009_remove_technologyaccess_duplicate_fields')
+    Household = apps.get_model('core', 'Household')
+    assert Household.objects.filter(has_internet=True, internet_type='MOB').count() == 1100
+    assert not Household.objects.filter(digital_access_index__isnull=True).exists()
@@ -0,0 +1,306 @@
+"""
+Tests for the save-time behaviour of the core models: when calculated
+scores are recalculated, and how denormalised fields are kept in sync.
+"""
+
+import pytest
+
+from core.models import Household, Person
+
+
+def _create_household(household_id='H1', **fields):
+    values = {
+        'province': 'GP',
+        'municipality': 'Johannesburg',
+        'area_type': 'URB',
+        'household_size': 2,
+        'has_electricity': True,
+        'internet_type': 'MOB',
+        'number_of_smartphones': 1,
+    }
+    values.update(fields)
+    return Household.objects.create(household_id=household_id, **values)
+
+
+def _create_person(household, person_id='P1', **fields):
+    values = {
+        'age': 20,
+        'gender': 'F',
+        'education_level': Person.EducationLevel.MATRIC,
+        'has_own_device': True,
+        'internet_usage_hours': 4.0,
+    }
+    values.update(fields)
+    return Person.objects.create(person_id=person_id, household=household, **values)
+
+
+@pytest.fixture
+def dai_calls(monkeypatch):
+    """
+    Count calls to Household.calculate_digital_access_index().
+    """
+    calls = []
+    calculate = Household.calculate_digital_access_index
+
+    def _calculate(self):
+        calls.append(self.pk)
+        return calculate(self)
+
+    monkeypatch.setattr(Household, 'calculate_digital_access_index', _calculate)
+    return calls
+
+
+@pytest.fixture
+def literacy_calls(monkeypatch):
+    """
+    Count calls to Person.calculate_digital_literacy_score().
+    """
+    calls = []
+    calculate = Person.calculate_digital_literacy_score
+
+    def _calculate(self):
+        calls.append(self.pk)
+        return calculate(self)
+
+    monkeypatch.setattr(Person, 'calculate_digital_literacy_score', _calculate)
+    return calls
+
+
+@pytest.mark.django_db
+def test_household_save_of_non_input_fields_skips_index(dai_calls):
+    household = Household.objects.get(pk=_create_household().pk)
+    stored_index = household.digital_access_index
+    dai_calls.clear()
+
+    household.municipality = 'Tshwane'
+    household.internet_type = 'FIBER'
+    household.save(update_fields=['municipality'])
+
+    assert dai_calls == []
+    household = Household.objects.get(pk=household.pk)
+    assert (household.municipality, household.internet_type) == ('Tshwane', 'MOB')
+    assert household.digital_access_index == stored_index
+
+
+@pytest.mark.django_db
+def test_household_save_of_input_field_writes_index():
+    household = Household.objects.get(pk=_create_household().pk)
+    update_fields = ['household_size']
+
+    household.household_size = 1
+    household.save(update_fields=update_fields)
+
+    assert update_fields == ['household_size']
+    expected = Household(
+        household_size=1, has_electricity=True, internet_type='MOB',
+        number_of_smartphones=1
+    ).calculate_digital_access_index()
+    assert household.digital_access_index == pytest.approx(expected)
+    assert Household.objects.get(pk=household.pk).digital_access_index == pytest.approx(
+        expected
+    )
+
+
+@pytest.mark.django_db
+def test_household_unchanged_save_keeps_stored_index():
+    household = _create_household()
+    # A stored value the calculation would never produce for these inputs
+    Household.objects.filter(pk=household.pk).update(digital_access_index=0.123)
+
+    household = Household.objects.get(pk=household.pk)
+    household.save()
+
+    assert household.digital_access_index == 0.123
+    assert Household.objects.get(pk=household.pk).digital_access_index == 0.123
+
+
+@pytest.mark.django_db
+def test_person_save_of_non_input_fields_skips_score(literacy_calls):
+    person = Person.objects.get(pk=_create_person(_create_household()).pk)
+    stored_score = person.digital_literacy_score
+    literacy_calls.clear()
+
+    person.age = 21
+    person.has_own_device = False
+    person.save(update_fields=['age'])
+
+    assert literacy_calls == []
+    person = Person.objects.get(pk=person.pk)
+    assert (person.age, person.has_own_device) == (21, True)
+    assert person.digital_literacy_score == stored_score
+
+
+@pytest.mark.django_db
+def test_person_save_of_input_field_writes_score():
+    person = Person.objects.get(pk=_create_person(_create_household()).pk)
+
+    person.internet_usage_hours = 8.0
+    person.save(update_fields=['internet_usage_hours'])
+
+    assert person.digital_literacy_score == pytest.approx(0.7)
+    assert Person.objects.get(pk=person.pk).digital_literacy_score == pytest.approx(0.7)
+
+
+@pytest.mark.django_db
+def test_person_unchanged_save_keeps_stored_score():
+    person = _create_person(_create_household())
+    # A stored value the calculation would never produce for these inputs
+    Person.objects.filter(pk=person.pk).update(digital_literacy_score=0.123)
+
+    person = Person.objects.get(pk=person.pk)
+    person.save()
+
+    assert person.digital_literacy_score == 0.123
+    assert Person.objects.get(pk=person.pk).digital_literacy_score == 0.123
+
+
+def test_household_index_cache_invalidated_by_input_change():
+    household = Household(household_size=2, has_electricity=True, internet_type='MOB',
+                          number_of_smartphones=1)
+    household.calculate_digital_access_index()
+
+    household.internet_type = 'FIBER'
+    household.household_size = 1
+
+    assert household.calculate_digital_access_index() == pytest.approx(1.0)
+
+
+def test_person_score_cache_invalidated_by_input_change():
+    person = Person(has_own_device=True, internet_usage_hours=4.0)
+    person.calculate_digital_literacy_score()
+
+    person.internet_usage_hours = 8.0
+    person.uses_internet_for_education = True
+
+    assert person.calculate_digital_literacy_score() == pytest.approx(1.0)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('fields', [
+    ('household_id', 'internet_type', 'number_of_computers', 'number_of_smartphones',
+     'household_size', 'has_electricity'),
+    ('household_id', 'digital_access_index'),
+])
+def test_household_cache_not_seeded_from_deferred_fields(fields):
+    _create_household()
+
+    household = Household.objects.only(*fields).get()
+
+    assert not hasattr(household, '_dai_cache')
+
+
+@pytest.mark.django_db
+def test_household_save_recalculates_null_index():
+    household = _create_household()
+    expected = household.digital_access_index
+    Household.objects.update(digital_access_index=None)
+
+    household = Household.objects.get(pk=household.pk)
+    assert not hasattr(household, '_dai_cache')
+    household.save()
+
+    assert household.digital_access_index == pytest.approx(expected)
+    assert Household.objects.get(pk=household.pk).digital_access_index == pytest.approx(
+        expected
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('fields', [
+    ('person_id', 'has_own_device', 'internet_usage_hours',
+     'uses_internet_for_education'),
+    ('person_id', 'digital_literacy_score'),
+])
+def test_person_cache_not_seeded_from_deferred_fields(fields):
+    _create_person(_create_household())
+
+    person = Person.objects.only(*fields).get()
+
+    assert not hasattr(person, '_literacy_cache')
+
+
+@pytest.mark.django_db
+def test_person_save_recalculates_null_score():
+    person = _create_person(_create_household())
+    expected = person.digital_literacy_score
+    Person.objects.update(digital_literacy_score=None)
+
+    person = Person.objects.get(pk=person.pk)
+    assert not hasattr(person, '_literacy_cache')
+    person.save()
+
+    assert person.digital_literacy_score == pytest.approx(expected)
+    assert Person.objects.get(pk=person.pk).digital_literacy_score == pytest.approx(
+        expected
+    )
+
+
+@pytest.mark.django_db
+def test_person_create_copies_household_internet(django_assert_num_queries):
+    household = _create_household(has_internet=True)
+
+    with django_assert_num_queries(1):
+        person = _create_person(household)
+    assert person.household_has_internet
+
+    # Assigning the household by id loads it first
+    with django_assert_num_queries(2):
+        person = Person.objects.create(
+            person_id='P2', household_id=household.pk, age=30, gender='M',
+            education_level=Person.EducationLevel.NONE
+        )
+    assert person.household_has_internet
+
+
+@pytest.mark.django_db
+def test_person_move_copies_new_household_internet():
+    person = Person.objects.get(pk=_create_person(_create_household()).pk)
+    connected = _create_household('H2', has_internet=True)
+
+    person.household = connected
+    person.save(update_fields=['household'])
+
+    assert Person.objects.get(pk=person.pk).household_has_internet
+
+    person.household_id = 'H1'
+    person.save()
+
+    assert not Person.objects.get(pk=person.pk).household_has_internet
+
+
+@pytest.mark.django_db
+def test_household_internet_toggle_updates_members(django_assert_num_queries):
+    household = _create_household()
+    _create_person(household)
+    household = Household.objects.get(pk=household.pk)
+
+    household.has_internet = True
+    with django_assert_num_queries(2):
+        household.save()
+    assert Person.objects.get().household_has_internet
+
+    household.has_internet = False
+    with django_assert_num_queries(2):
+        household.save(update_fields=['has_internet'])
+    assert not Person.objects.get().household_has_internet
+
+
+@pytest.mark.django_db
+def test_household_save_without_internet_change_skips_members(django_assert_num_queries):
+    household = _create_household()
+    _create_person(household)
+    household = Household.objects.get(pk=household.pk)
+
+    household.municipality = 'Tshwane'
+    with django_assert_num_queries(1):
+        household.save()
+
+    # Unsaved internet changes are not copied when update_fields omits them
+    household.has_internet = True
+    with django_assert_num_queries(1):
+        household.save(update_fields=['municipality'])
+    assert not Person.objects.get().household_has_internet
+
+    with django_assert_num_queries(2):
+        household.save()
+    assert Person.objects.get().household_has_internet
@@ -0,0 +1,52 @@
+"""
+Tests for rebuilding the precomputed DigitalAccessRollup table.
+"""
+
+import pytest
+from django.utils import timezone
+
+from core.models import DigitalAccessRollup, Household
+
+
+def _create_household(household_id, province, municipality, area_type, **fields):
+    return Household.objects.create(
+        household_id=household_id,
+        province=province,
+        municipality=municipality,
+        area_type=area_type,
+        household_size=2,
+        **fields
+    )
+
+
+@pytest.mark.django_db
+def test_refresh_aggregates_per_province_and_area_type():
+    # Several municipalities in one province and area type must still give
+    # one row: the default ['province', 'municipality'] ordering must not
+    # leak into the GROUP BY
+    gauteng_urban = [
+        _create_household('H1', 'GP', 'Johannesburg', 'URB', internet_type='FIBER',
+                          has_electricity=True, number_of_computers=2),
+        _create_household('H2', 'GP', 'Tshwane', 'URB', internet_type='MOB',
+                          number_of_computers=1),
+        _create_household('H3', 'GP', 'Ekurhuleni', 'URB'),
+    ]
+    gauteng_rural = _create_household('H4', 'GP', 'Sedibeng', 'RUR',
+                                      has_electricity=True, number_of_computers=3)
+    DigitalAccessRollup.objects.create(
+        province='EC', area_type='INF', household_count=1, total_computers=0,
+        refreshed_at=timezone.now()
+    )
+
+    assert DigitalAccessRollup.objects.refresh() == 2
+
+    rollups = list(DigitalAccessRollup.objects.values_list(
+        'province', 'area_type', 'household_count', 'mean_digital_access_index',
+        'total_computers'
+    ))
+    assert rollups == [
+        ('GP', 'RUR', 1, pytest.approx(gauteng_rural.digital_access_index), 3),
+        ('GP', 'URB', 3, pytest.approx(
+            sum(household.digital_access_index for household in gauteng_urban) / 3
+        ), 3),
+    ]
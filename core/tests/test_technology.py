@@ -0,0 +1,55 @@
+"""
+Tests for the packed smart device flags on TechnologyAccess.
+"""
+
+import pytest
+from django.db import IntegrityError
+
+from core.models import Household, TechnologyAccess
+
+
+def _create_technology(household_id, **fields):
+    household = Household.objects.create(
+        household_id=household_id,
+        province='GP',
+        municipality='Johannesburg',
+        area_type='URB',
+        household_size=2,
+    )
+    return TechnologyAccess.objects.create(household=household, **fields)
+
+
+def test_smart_device_properties_ignore_undefined_bits():
+    technology = TechnologyAccess(smart_device_flags=8)
+
+    assert not technology.has_any_smart_devices()
+
+    technology.has_smart_speaker = True
+    assert technology.has_any_smart_devices()
+    assert (technology.has_smart_tv, technology.has_smart_speaker,
+            technology.has_smart_thermostat) == (False, True, False)
+
+
+@pytest.mark.django_db
+def test_with_smart_devices_filters_on_flags():
+    for flags in range(8):
+        _create_technology(f'H{flags}', smart_device_flags=flags)
+
+    def household_flags(queryset):
+        return sorted(int(technology.household_id[1:]) for technology in queryset)
+
+    assert household_flags(TechnologyAccess.objects.with_smart_devices()) == [
+        1, 2, 3, 4, 5, 6, 7
+    ]
+    assert household_flags(TechnologyAccess.objects.with_smart_devices(
+        TechnologyAccess.SMART_TV
+    )) == [1, 3, 5, 7]
+    assert household_flags(TechnologyAccess.objects.with_smart_devices(
+        TechnologyAccess.SMART_SPEAKER, TechnologyAccess.SMART_THERMOSTAT
+    )) == [6, 7]
+
+
+@pytest.mark.django_db
+def test_smart_device_flags_rejects_undefined_bits():
+    with pytest.raises(IntegrityError):
+        _create_technology('H1', smart_device_flags=8)